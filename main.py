@@ -14,7 +14,7 @@ Usage:
 Requirements:
     - Python 3.x
     - google-auth, google-auth-oauthlib, google-api-python-client,
-      google-cloud-bigquery, pandas, pandas-gbq, prettytable
+      google-cloud-bigquery, pandas, pyarrow, orjson, prettytable
 
 Configuration:
     - Replace the placeholder file paths and project IDs below with your own.
@@ -23,17 +23,33 @@ Configuration:
 """
 
 import os
-import json
+import sys
+import threading
+import uuid
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+import httplib2
+import numpy as np
+import orjson
 import pandas as pd
-import pandas_gbq
+import pyarrow as pa
+import pyarrow.compute as pc
+import requests
+from google.api_core import retry
+from google.api_core.exceptions import Conflict
 from google.oauth2 import service_account
+from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 from google.cloud import bigquery
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from prettytable import PrettyTable
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 # Configuration Constants (Update these with your own paths and project details)
 SCOPES = ['https://www.googleapis.com/auth/adsense.readonly',
@@ -49,19 +65,110 @@ CREDENTIALS_FILE_3 = "path/to/your/adsense_credentials_3.json"
 CREDENTIALS_FILE_4 = "path/to/your/adsense_credentials_4.json"
 # CREDENTIALS_FILE_5 = "path/to/your/adsense_credentials_5.json"  # Optional additional credential
 
+# Every set of credentials whose accounts are processed
+CREDENTIALS_FILES = [CREDENTIALS_FILE, CREDENTIALS_FILE_2, CREDENTIALS_FILE_3, CREDENTIALS_FILE_4]
+# CREDENTIALS_FILES.append(CREDENTIALS_FILE_5)  # Optional additional credential
+
+# Access tokens expiring within this window are refreshed before the first API call
+TOKEN_REFRESH_WINDOW = timedelta(minutes=5)
+
 # BigQuery settings (update these with your BigQuery project information)
 BIGQUERY_PROJECT_ID = 'your_bigquery_project_id'
 BIGQUERY_DATASET_ID = 'your_bigquery_dataset'
 BIGQUERY_TABLE_ID = 'your_bigquery_table'
 BIGQUERY_SERVICE_ACCOUNT_KEY_FILE = "path/to/your/bigquery_service_account_key.json"
 TABLE_FULL_NAME = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.{BIGQUERY_TABLE_ID}"
+# Query used to remove already loaded data from an unpartitioned table
+DELETE_QUERY = f"DELETE FROM `{TABLE_FULL_NAME}` WHERE date >= @cutoff"
+# Set to True if the table is DATE-partitioned on `date` (see the README). Fetched dates
+# are then loaded by overwriting their partitions instead of running a DELETE query.
+BIGQUERY_TABLE_PARTITIONED = True
+
+# Schema of the target BigQuery table (see the README for the matching DDL)
+BIGQUERY_SCHEMA = [
+    bigquery.SchemaField('account_id', 'STRING'),
+    bigquery.SchemaField('date', 'DATE'),
+    bigquery.SchemaField('domain', 'STRING'),
+    bigquery.SchemaField('country', 'STRING'),
+    bigquery.SchemaField('ESTIMATED_EARNINGS', 'FLOAT64'),
+    bigquery.SchemaField('PAGE_VIEWS', 'INT64'),
+    bigquery.SchemaField('PAGE_VIEWS_RPM', 'FLOAT64'),
+    bigquery.SchemaField('CLICKS', 'INT64'),
+    bigquery.SchemaField('ctr', 'FLOAT64'),
+    bigquery.SchemaField('cpc', 'FLOAT64'),
+    bigquery.SchemaField('TOTAL_IMPRESSIONS', 'INT64'),
+    bigquery.SchemaField('AD_REQUESTS', 'INT64'),
+    bigquery.SchemaField('MATCHED_AD_REQUESTS', 'INT64'),
+    bigquery.SchemaField('IMPRESSIONS', 'INT64'),
+    bigquery.SchemaField('INDIVIDUAL_AD_IMPRESSIONS', 'INT64'),
+]
+
+# Report metrics that hold integer counts (all other metrics are floats)
+INT_METRICS = {
+    'CLICKS', 'PAGE_VIEWS', 'TOTAL_IMPRESSIONS', 'IMPRESSIONS',
+    'INDIVIDUAL_AD_IMPRESSIONS', 'MATCHED_AD_REQUESTS', 'AD_REQUESTS'
+}
+
+# Upper bounds for a single chunk when appending to an unpartitioned BigQuery table
+MAX_UPLOAD_BYTES = 8_000_000
+MAX_UPLOAD_ROWS = 50_000
+
+# Maximum number of report requests per batch HTTP request (Google API limit)
+BATCH_SIZE = 50
+
+# Maximum number of concurrent AdSense API requests
+MAX_WORKERS = 16
+
+# HTTP status codes of AdSense API responses that are retried
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Transport shared by all credential refreshes, so they reuse the same connections
+AUTH_REQUEST = Request(session=requests.Session())
+
+# Serializes the interactive OAuth flows of credentials that are authenticated concurrently
+OAUTH_FLOW_LOCK = threading.Lock()
+
+
+def is_transient_error(exception):
+    """
+    Check whether a failed Google API call is worth retrying.
+
+    AdSense calls raise googleapiclient HttpErrors while BigQuery calls raise
+    google.api_core exceptions; transient errors of both kinds are retried.
+    """
+    if isinstance(exception, HttpError):
+        return exception.resp.status in TRANSIENT_STATUS_CODES
+    return (retry.if_transient_error(exception)
+            or isinstance(exception, (ConnectionError, TimeoutError, httplib2.HttpLib2Error)))
+
+
+# Exponential backoff applied to AdSense and BigQuery calls failing with transient errors
+RETRY_POLICY = retry.Retry(
+    predicate=is_transient_error,
+    initial=1.0,
+    maximum=10.0,
+    multiplier=2.0,
+    timeout=120.0,
+    on_error=lambda e: print(f"Transient error, retrying: {e}")
+)
+
+
+@lru_cache(maxsize=None)
+def adsense_discovery_doc():
+    """
+    Return the AdSense API discovery document.
+
+    The document ships with google-api-python-client; it is parsed once and shared
+    by every AdSense service instead of being loaded for each set of credentials.
+    """
+    return orjson.loads(discovery_cache.get_static_doc('adsense', 'v2'))
 
 
 class BigQueryClient:
     """
     Client for interacting with Google BigQuery.
 
-    Provides methods to delete yesterday's data (to avoid duplicates) and
+    Provides methods to replace already loaded data (to avoid duplicates) and
     push new AdSense report data into a BigQuery table.
     """
     def __init__(self):
@@ -74,49 +181,105 @@ class BigQueryClient:
                                       project=BIGQUERY_PROJECT_ID)
         print("BigQuery client initialized.")
 
-    def delete_yesterday_data(self):
+    def delete_yesterday_data(self, now=None):
         """
         Delete data from yesterday in the target BigQuery table.
-        This prevents duplicate entries when new data is inserted.
-        """
-        current_date = datetime.now()
-        previous_date = (current_date - timedelta(days=1)).strftime('%Y-%m-%d')
-        query = f"""
-        DELETE FROM `{TABLE_FULL_NAME}`
-        WHERE date >= '{previous_date}'
+        This prevents duplicate entries when new data is inserted. Pass the `now`
+        used to fetch the reports so that the deleted dates match the reloaded ones.
         """
+        previous_date = ((now or datetime.now()) - timedelta(days=1)).date()
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter('cutoff', 'DATE', previous_date)
+        ])
         print(f"Deleting yesterday's data ({previous_date}) from BigQuery...")
-        query_job = self.client.query(query)
+        query_job = self.client.query(DELETE_QUERY, job_config=job_config)
         query_job.result()  # Wait for the query to complete
         print("Yesterday's data deleted successfully.")
 
-    def push_to_bigquery(self, df):
+    def load_chunk(self, df, destination, job_config, job_ids):
+        """
+        Run a single load job for the given DataFrame and wait for it to complete.
+
+        `job_ids` holds the job IDs used for this chunk so far. A retried attempt
+        reuses the last one: if BigQuery already accepted that job, it is awaited
+        instead of loading the rows a second time. A new job is only started once
+        the previous one is known to have failed.
+        """
+        try:
+            load_job = self.client.load_table_from_dataframe(df, destination,
+                                                             job_config=job_config,
+                                                             job_id=job_ids[-1])
+        except Conflict:
+            load_job = self.client.get_job(job_ids[-1])
+            if load_job.done() and load_job.error_result:
+                # The earlier job loaded no rows, so the chunk can be loaded again
+                job_ids.append(f"{job_ids[0]}_{len(job_ids)}")
+                load_job = self.client.load_table_from_dataframe(df, destination,
+                                                                 job_config=job_config,
+                                                                 job_id=job_ids[-1])
+        load_job.result()  # Wait for the load job to complete
+
+    def load_dataframe(self, df, destination, write_disposition):
+        """
+        Load the given DataFrame into the destination table (or partition) with a
+        single load job.
+
+        The data is sent as Parquet with an explicit schema, which avoids both the
+        CSV serialization and the schema autodetection of a generic load job. The job
+        is retried on transient errors.
+        """
+        job_config = bigquery.LoadJobConfig(
+            write_disposition=write_disposition,
+            source_format=bigquery.SourceFormat.PARQUET,
+            schema=BIGQUERY_SCHEMA
+        )
+        job_ids = [f"adsense_load_{uuid.uuid4().hex}"]
+        print(f"Uploading {len(df)} rows to {destination}...")
+        RETRY_POLICY(self.load_chunk)(df, destination, job_config, job_ids)
+
+    def append_dataframe(self, df, destination):
+        """
+        Append the given DataFrame to the destination table in size-bounded chunks.
+
+        Every chunk is committed by its own load job, so a failed chunk leaves the
+        earlier ones in place. This is only used for appends; partition overwrites
+        go through a single load_dataframe() call to stay atomic.
+        """
+        approx_row_bytes = df.memory_usage(deep=True).sum() / max(len(df), 1)
+        chunk_rows = max(1, min(MAX_UPLOAD_ROWS, int(MAX_UPLOAD_BYTES / approx_row_bytes)))
+        chunk_count = -(-len(df) // chunk_rows)
+        print(f"Appending {len(df)} rows to {destination} in {chunk_count} chunk(s)...")
+
+        for start in range(0, len(df), chunk_rows):
+            self.load_dataframe(df.iloc[start:start + chunk_rows], destination,
+                                bigquery.WriteDisposition.WRITE_APPEND)
+
+    def push_to_bigquery(self, df, now=None):
         """
         Push the given DataFrame to BigQuery.
-        
-        Before insertion, certain columns are converted to integers and yesterday's
-        data is deleted from the target table.
+
+        Existing data for the fetched dates is replaced: on a partitioned table each
+        date partition is overwritten by a load job, otherwise yesterday's data
+        (relative to `now`) is deleted first.
         """
         if df.empty:
             print("No data to insert into BigQuery.")
             return
 
-        # Define columns that should be converted to integer type
-        int_cols = [
-            'CLICKS', 'PAGE_VIEWS', 'TOTAL_IMPRESSIONS', 'IMPRESSIONS',
-            'INDIVIDUAL_AD_IMPRESSIONS', 'MATCHED_AD_REQUESTS', 'AD_REQUESTS'
-        ]
-        df[int_cols] = df[int_cols].fillna(0).astype(int)
-
         # Rename columns to match your BigQuery schema (if needed)
         df = df.rename(columns={'AD_REQUESTS_CTR': 'ctr', 'COST_PER_CLICK': 'cpc'})
 
-        # Remove yesterday's data to avoid duplicates
-        self.delete_yesterday_data()
-
         print(f"Pushing {len(df)} rows to BigQuery...")
-        pandas_gbq.to_gbq(df, TABLE_FULL_NAME, project_id=BIGQUERY_PROJECT_ID,
-                            if_exists='append', credentials=self.credentials)
+        if BIGQUERY_TABLE_PARTITIONED:
+            # Overwrite the partition of every fetched date, which avoids a DML query
+            for report_date, partition_df in df.groupby('date'):
+                destination = f"{TABLE_FULL_NAME}${report_date.strftime('%Y%m%d')}"
+                self.load_dataframe(partition_df, destination,
+                                    bigquery.WriteDisposition.WRITE_TRUNCATE)
+        else:
+            # Remove yesterday's data to avoid duplicates
+            self.delete_yesterday_data(now)
+            self.append_dataframe(df, TABLE_FULL_NAME)
         print("Data successfully inserted into BigQuery.")
 
 
@@ -125,139 +288,286 @@ class AdSenseAPI:
     Class to interact with the Google AdSense API.
 
     Handles authentication via OAuth2 and provides methods to list AdSense
-    accounts and fetch reports.
+    accounts and fetch reports. Authentication is deferred until the service is
+    first used, so unused credentials are never loaded or refreshed.
     """
     def __init__(self, client_secrets_file, credentials_file):
-        self.service = None
+        self._service = None
         self.credentials = None
         self.client_secrets_file = client_secrets_file
         self.credentials_file = credentials_file
-        self.authenticate()
+        self.thread_local = threading.local()
+        self.auth_lock = threading.Lock()
+
+    @property
+    def service(self):
+        """
+        The AdSense API service, authenticating on first access.
+        """
+        self.ensure_authenticated()
+        return self._service
+
+    def ensure_authenticated(self):
+        """
+        Authenticate unless this instance has already been authenticated.
+        """
+        with self.auth_lock:
+            if self._service is None:
+                self.authenticate()
 
     def authenticate(self):
         """
-        Authenticate using saved credentials if available. If credentials are
-        expired or missing, the OAuth flow is initiated.
+        Authenticate using saved credentials if available. Credentials that are
+        expired or about to expire are refreshed and saved back to disk, so the next
+        run starts with a valid access token. If credentials are missing or cannot be
+        refreshed, the OAuth flow is initiated.
         """
         print(f"Authenticating with credentials file: {self.credentials_file}")
         if os.path.exists(self.credentials_file):
-            self.credentials = Credentials.from_authorized_user_file(self.credentials_file, SCOPES)
+            with open(self.credentials_file, 'rb') as token:
+                self.credentials = Credentials.from_authorized_user_info(orjson.loads(token.read()),
+                                                                         SCOPES)
             print(f"Using existing credentials from {self.credentials_file}")
 
-        if self.credentials and self.credentials.expired and self.credentials.refresh_token:
+        if self.credentials and self.credentials.refresh_token and self.needs_refresh():
             print("Refreshing expired credentials...")
-            self.credentials.refresh(Request())
+            try:
+                self.credentials.refresh(AUTH_REQUEST)
+                self.save_credentials()
+            except RefreshError as e:
+                print(f"Error refreshing credentials: {e}")
+                self.credentials = None
 
         if not self.credentials or not self.credentials.valid:
-            print("No valid credentials found. Starting OAuth flow...")
-            flow = InstalledAppFlow.from_client_secrets_file(self.client_secrets_file, SCOPES)
-            self.credentials = flow.run_local_server(port=0)
-            os.makedirs(os.path.dirname(self.credentials_file), exist_ok=True)
-            with open(self.credentials_file, 'w') as token:
-                token.write(self.credentials.to_json())
-            print("OAuth flow completed, credentials saved.")
-
-        self.service = build('adsense', 'v2', credentials=self.credentials)
+            # Interactive logins run one at a time, so it is clear which account to sign
+            # in with for which credentials file
+            with OAUTH_FLOW_LOCK:
+                print(f"No valid credentials found in {self.credentials_file}. Starting OAuth flow...")
+                flow = InstalledAppFlow.from_client_secrets_file(self.client_secrets_file, SCOPES)
+                self.credentials = flow.run_local_server(port=0)
+                self.save_credentials()
+                print(f"OAuth flow completed, credentials saved to {self.credentials_file}.")
+
+        self._service = build_from_document(adsense_discovery_doc(),
+                                            credentials=self.credentials)
         print("AdSense service initialized.")
 
+    def needs_refresh(self):
+        """
+        Check whether the access token is expired or expires within the refresh window.
+        """
+        if self.credentials.expired or not self.credentials.expiry:
+            return True
+        # Credentials expiry is a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return self.credentials.expiry - now < TOKEN_REFRESH_WINDOW
+
+    def save_credentials(self):
+        """
+        Save the current credentials, including the access token, to the credentials file.
+        """
+        credentials_dir = os.path.dirname(self.credentials_file)
+        if credentials_dir:
+            os.makedirs(credentials_dir, exist_ok=True)
+        with open(self.credentials_file, 'w') as token:
+            token.write(self.credentials.to_json())
+
+    def http(self):
+        """
+        Return an authorized HTTP transport for the calling thread.
+
+        httplib2 connections are not thread-safe, so each worker thread keeps its own
+        transport and reuses its connections for all of its requests.
+        """
+        if not hasattr(self.thread_local, 'http'):
+            self.ensure_authenticated()
+            self.thread_local.http = AuthorizedHttp(self.credentials, http=build_http())
+        return self.thread_local.http
+
     def list_accounts(self):
         """
         List all AdSense accounts associated with the authenticated user.
-        
+
+        The accounts are printed as a table only when running in a terminal, so
+        scheduled runs skip the table rendering.
+
         Returns:
             A list of account IDs.
         """
         try:
             print("Fetching AdSense accounts...")
-            accounts = self.service.accounts().list().execute()
-            account_ids = []
-            table = PrettyTable()
-            table.field_names = ["Account ID", "Display Name"]
-
-            for account in accounts.get('accounts', []):
-                account_id = account['name']
-                display_name = account['displayName']
-                table.add_row([account_id, display_name])
-                account_ids.append(account_id)
-
-            print("\nAvailable AdSense Accounts:")
-            print(table)
+            request = self.service.accounts().list()
+            accounts = RETRY_POLICY(request.execute)(http=self.http()).get('accounts', [])
+            account_ids = [account['name'] for account in accounts]
+
+            if sys.stdout.isatty():
+                from prettytable import PrettyTable
+
+                table = PrettyTable()
+                table.field_names = ["Account ID", "Display Name"]
+                for account in accounts:
+                    table.add_row([account['name'], account['displayName']])
+                print("\nAvailable AdSense Accounts:")
+                print(table)
+            else:
+                print(f"Found {len(account_ids)} AdSense account(s).")
             return account_ids
-        except Exception as e:
+        except HttpError as e:
             print(f"Error listing AdSense accounts: {e}")
             return []
 
-    def fetch_report(self, account_id):
+    def report_request(self, account_id, now=None):
         """
-        Fetch the AdSense report for a given account.
+        Build the report request for a given account.
 
-        Retrieves metrics for the period from yesterday to today and returns the data
-        as a Pandas DataFrame.
+        The report covers the period from yesterday to today, relative to `now`.
 
         Returns:
-            DataFrame containing the report data.
+            An unexecuted HttpRequest for the report.
         """
-        previous_date = datetime.now() - timedelta(days=1)
-        current_dt = datetime.now()
+        current_dt = now or datetime.now()
+        previous_date = current_dt - timedelta(days=1)
         print(f"Fetching report for account: {account_id} for dates: {previous_date.date()} to {current_dt.date()}")
-        try:
-            report = self.service.accounts().reports().generate(
-                account=account_id,
-                dateRange='CUSTOM',
-                startDate_year=previous_date.year,
-                startDate_month=previous_date.month,
-                startDate_day=previous_date.day,
-                endDate_year=current_dt.year,
-                endDate_month=current_dt.month,
-                endDate_day=current_dt.day,
-                metrics=[
-                    'ESTIMATED_EARNINGS', 'PAGE_VIEWS', 'PAGE_VIEWS_RPM', 'CLICKS',
-                    'AD_REQUESTS_CTR', 'COST_PER_CLICK', 'TOTAL_IMPRESSIONS',
-                    'AD_REQUESTS', 'MATCHED_AD_REQUESTS', 'IMPRESSIONS',
-                    'INDIVIDUAL_AD_IMPRESSIONS'
-                ],
-                dimensions=['DATE', 'DOMAIN_NAME', 'COUNTRY_CODE']
-            ).execute()
-
-            if 'rows' not in report:
-                print("No rows found in the report.")
-                return pd.DataFrame()
-
-            rows = []
-            for row in report['rows']:
-                report_date = row['cells'][0]['value']
-                domain = row['cells'][1]['value']
-                country = row['cells'][2]['value']
-                metrics = {
-                    header['name']: float(cell['value'])
-                    for header, cell in zip(report['headers'][3:], row['cells'][3:])
-                }
-                row_data = {
-                    "account_id": account_id,
-                    "date": report_date,
-                    "domain": domain,
-                    "country": country,
-                    **metrics
-                }
-                rows.append(row_data)
-
-            return pd.DataFrame(rows)
-        except Exception as e:
-            print(f"Error fetching AdSense report: {e}")
+        return self.service.accounts().reports().generate(
+            account=account_id,
+            dateRange='CUSTOM',
+            startDate_year=previous_date.year,
+            startDate_month=previous_date.month,
+            startDate_day=previous_date.day,
+            endDate_year=current_dt.year,
+            endDate_month=current_dt.month,
+            endDate_day=current_dt.day,
+            metrics=[
+                'ESTIMATED_EARNINGS', 'PAGE_VIEWS', 'PAGE_VIEWS_RPM', 'CLICKS',
+                'AD_REQUESTS_CTR', 'COST_PER_CLICK', 'TOTAL_IMPRESSIONS',
+                'AD_REQUESTS', 'MATCHED_AD_REQUESTS', 'IMPRESSIONS',
+                'INDIVIDUAL_AD_IMPRESSIONS'
+            ],
+            dimensions=['DATE', 'DOMAIN_NAME', 'COUNTRY_CODE']
+        )
+
+    def parse_report(self, account_id, report):
+        """
+        Convert a report response for a given account into a Pandas DataFrame.
+
+        Returns:
+            DataFrame containing the report data.
+        """
+        if 'rows' not in report:
+            print(f"No rows found in the report for account: {account_id}")
             return pd.DataFrame()
 
+        # Reports are not paginated: rows beyond the API row limit are truncated
+        total_rows = int(report.get('totalMatchedRows', len(report['rows'])))
+        if total_rows > len(report['rows']):
+            print(f"Warning: report for account {account_id} was truncated to "
+                  f"{len(report['rows'])} of {total_rows} rows.")
+
+        # Collect the report column by column rather than as a list of row dicts.
+        # Metrics are stored in typed arrays, so integer counts arrive as int64 and
+        # no Python float objects are kept around. Missing metric values become 0.
+        metric_names = tuple(header['name'] for header in report['headers'][3:])
+        cols = {
+            "account_id": [],
+            "date": [],
+            "domain": [],
+            "country": [],
+            **{name: array('q' if name in INT_METRICS else 'd') for name in metric_names}
+        }
+        # Resolve the cell index, target column and type of every metric once per report
+        metric_columns = tuple(
+            (index, cols[name].append, name in INT_METRICS)
+            for index, name in enumerate(metric_names, start=3)
+        )
+        for row in report['rows']:
+            cells = row['cells']
+            cols["date"].append(cells[0]['value'])
+            cols["domain"].append(cells[1]['value'])
+            cols["country"].append(cells[2]['value'])
+            for index, append, is_int in metric_columns:
+                value = cells[index].get('value')
+                append(int(value or 0) if is_int else float(value or 0))
+        cols["account_id"] = [account_id] * len(cols["date"])
+
+        # Build Arrow-backed columns: the metric buffers are wrapped without copying,
+        # dates are parsed into DATE values, and the load job serializes the columns to
+        # Parquet without reconstructing Python objects.
+        arrays = {
+            "account_id": pa.array(cols["account_id"], pa.string()),
+            "date": pc.strptime(pa.array(cols["date"], pa.string()),
+                                format='%Y-%m-%d', unit='s').cast(pa.date32()),
+            "domain": pa.array(cols["domain"], pa.string()),
+            "country": pa.array(cols["country"], pa.string()),
+        }
+        for name in metric_names:
+            dtype = np.int64 if name in INT_METRICS else np.float64
+            arrays[name] = pa.array(np.frombuffer(cols[name], dtype=dtype))
+
+        return pa.table(arrays).to_pandas(types_mapper=pd.ArrowDtype)
+
+    def fetch_reports_batch(self, account_ids, now=None):
+        """
+        Fetch the AdSense reports for several accounts using batch HTTP requests.
+
+        Up to BATCH_SIZE report requests are sent in a single multipart HTTP request,
+        instead of one round-trip per account. This saves round-trips, not memory:
+        the whole multipart response of a batch is read and split before any report
+        is parsed, so peak memory grows with the batch size.
+
+        Returns:
+            A list of DataFrames, one per account whose report was fetched.
+        """
+        frames = []
+        for start in range(0, len(account_ids), BATCH_SIZE):
+            pending = list(account_ids[start:start + BATCH_SIZE])
+            RETRY_POLICY(self.execute_batch)(pending, frames, now)
+        return frames
+
+    def execute_batch(self, pending, frames, now=None):
+        """
+        Execute one batch HTTP request for the reports of the pending accounts.
+
+        Parsed reports are appended to `frames`, and accounts whose report was fetched
+        or failed permanently (including reports that cannot be parsed) are removed
+        from `pending`. The first transient error is raised afterwards, so that a
+        retry only requests the remaining accounts.
+        """
+        transient_errors = []
+
+        def handle_response(account_id, response, exception):
+            if exception is not None and is_transient_error(exception):
+                transient_errors.append(exception)
+                return
+            if exception is not None:
+                print(f"Error fetching AdSense report for account {account_id}: {exception}")
+            else:
+                try:
+                    frames.append(self.parse_report(account_id, response))
+                except (KeyError, ValueError, IndexError, pa.ArrowInvalid) as e:
+                    print(f"Error parsing AdSense report for account {account_id}: {e}")
+            pending.remove(account_id)
+
+        batch = self.service.new_batch_http_request()
+        for account_id in pending:
+            batch.add(
+                self.report_request(account_id, now),
+                callback=lambda request_id, response, exception, account_id=account_id:
+                    handle_response(account_id, response, exception)
+            )
+        batch.execute(http=self.http())
+
+        if transient_errors:
+            raise transient_errors[0]
+
 
 class AdSenseReportProcessor:
     """
     Processes AdSense reports from multiple accounts and uploads the consolidated data to BigQuery.
     """
     def __init__(self):
-        # Initialize multiple AdSense API instances if you have more than one set of credentials.
-        self.adsense_api_1 = AdSenseAPI(CLIENT_SECRETS_FILE, CREDENTIALS_FILE)
-        self.adsense_api_2 = AdSenseAPI(CLIENT_SECRETS_FILE, CREDENTIALS_FILE_2)
-        self.adsense_api_3 = AdSenseAPI(CLIENT_SECRETS_FILE, CREDENTIALS_FILE_3)
-        self.adsense_api_4 = AdSenseAPI(CLIENT_SECRETS_FILE, CREDENTIALS_FILE_4)
-        # self.adsense_api_5 = AdSenseAPI(CLIENT_SECRETS_FILE, CREDENTIALS_FILE_5)  # Optional
+        # Initialize one AdSense API instance per set of credentials
+        self.apis = [AdSenseAPI(CLIENT_SECRETS_FILE, credentials_file)
+                     for credentials_file in CREDENTIALS_FILES]
 
         self.bigquery_client = BigQueryClient()
 
@@ -265,41 +575,36 @@ class AdSenseReportProcessor:
         """
         Fetch reports from all configured AdSense accounts, consolidate the data,
         and upload the result to BigQuery.
+
+        Account listing and report fetching are I/O-bound, so they run concurrently
+        in a thread pool and the total wall-time is bounded by the slowest request.
+        The reports of each set of credentials are fetched with batch HTTP requests.
         """
-        all_data = pd.DataFrame()
-
-        # Process accounts from the first set of credentials
-        for adsense_api in [self.adsense_api_1]:
-            for account_id in adsense_api.list_accounts():
-                df = adsense_api.fetch_report(account_id)
-                all_data = pd.concat([all_data, df], ignore_index=True)
-
-        # Process accounts from the second set of credentials
-        for adsense_api in [self.adsense_api_2]:
-            for account_id in adsense_api.list_accounts():
-                df = adsense_api.fetch_report(account_id)
-                all_data = pd.concat([all_data, df], ignore_index=True)
-
-        # Process accounts from the third set of credentials
-        for adsense_api in [self.adsense_api_3]:
-            for account_id in adsense_api.list_accounts():
-                df = adsense_api.fetch_report(account_id)
-                all_data = pd.concat([all_data, df], ignore_index=True)
-
-        # Process accounts from the fourth set of credentials
-        for adsense_api in [self.adsense_api_4]:
-            for account_id in adsense_api.list_accounts():
-                df = adsense_api.fetch_report(account_id)
-                all_data = pd.concat([all_data, df], ignore_index=True)
-
-        # Uncomment the block below if you wish to process an additional set of credentials.
-        # for adsense_api in [self.adsense_api_5]:
-        #     for account_id in adsense_api.list_accounts():
-        #         df = adsense_api.fetch_report(account_id)
-        #         all_data = pd.concat([all_data, df], ignore_index=True)
+        # Use a single reference time so every account reports the same date range
+        now = datetime.now()
+        frames = []
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # List the accounts for every set of credentials concurrently, which also
+            # authenticates the sets of credentials in parallel
+            account_futures = {executor.submit(api.list_accounts): api for api in self.apis}
+            report_futures = []
+            for future in as_completed(account_futures):
+                api = account_futures[future]
+                account_ids = future.result()
+                if account_ids:
+                    report_futures.append(
+                        executor.submit(api.fetch_reports_batch, account_ids, now)
+                    )
+
+            # Collect the per-account reports as they complete. Empty reports are
+            # skipped so they do not take part in the dtype resolution of the concat.
+            for future in as_completed(report_futures):
+                frames.extend(df for df in future.result() if not df.empty)
+
+        all_data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
         if not all_data.empty:
-            self.bigquery_client.push_to_bigquery(all_data)
+            self.bigquery_client.push_to_bigquery(all_data, now)
         else:
             print("No data fetched from AdSense accounts.")
 